@@ -5,20 +5,127 @@ Research Implementation by Akshay Govindareddy
 
 """
 
+import os
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Figures are only written to disk, no GUI needed
 import matplotlib.pyplot as plt
-import seaborn as sns
 import warnings
 warnings.filterwarnings('ignore')
 
+# Set publication-quality style
+plt.style.use('default')
+plt.rcParams.update({
+    'font.size': 11,
+    'axes.titlesize': 14,
+    'axes.labelsize': 12,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.titlesize': 16,
+    'lines.linewidth': 2,
+    'axes.linewidth': 1.2,
+    'grid.linewidth': 0.8,
+    'grid.alpha': 0.3
+})
+
+# Figures are embedded individually in the README, so each panel keeps its own
+# file; 150 dpi is plenty for flat bar/pie charts and renders ~4x fewer pixels
+FIGURE_DPI = 150
+
+DATA_PATH = 'data/processed/spill_incidents_clean.csv'
+# Binary copy of the analysed columns, rebuilt whenever the CSV is newer
+CACHE_PATH = 'data/processed/spill_incidents_clean.parquet'
+
+# Only the columns used by the analysis are read from the cleaned dataset;
+# repeated labels are stored as categoricals
+USECOLS = ['town', 'release_hour', 'release_year', 'substance_category', 'cause_category']
+DTYPES = {
+    'town': 'category',
+    'substance_category': 'category',
+    'cause_category': 'category',
+    'release_hour': 'float32',
+    'release_year': 'int16'
+}
+
+# Define professional color palette
+COLORS = {
+    'primary': '#1f77b4',
+    'secondary': '#ff7f0e', 
+    'accent': '#2ca02c',
+    'highlight': '#d62728',
+    'neutral': '#7f7f7f'
+}
+
+def load_data():
+    """Load the cleaned dataset, reusing the parquet cache when it is current"""
+    if (os.path.exists(CACHE_PATH) and
+            os.path.getmtime(CACHE_PATH) >= os.path.getmtime(DATA_PATH)):
+        try:
+            return pd.read_parquet(CACHE_PATH, columns=USECOLS)
+        except (ImportError, OSError, ValueError):
+            pass  # No parquet engine or stale/corrupt cache: fall back to the CSV
+    
+    data = pd.read_csv(DATA_PATH, usecols=USECOLS, dtype=DTYPES, engine='c')
+    try:
+        data.to_parquet(CACHE_PATH, compression='zstd')
+    except (ImportError, OSError):
+        pass  # Caching is best-effort
+    return data
+
+def category_counts(series, top_n=None):
+    """Count a categorical column with np.bincount over its integer codes"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts().iloc[:top_n]
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    order = np.argsort(-counts, kind='stable')[:top_n]
+    return pd.Series(counts[order], index=series.cat.categories[order], name='count')
+
+# Below this many rows the NumPy path is faster than paying for JIT compilation
+NUMBA_MIN_ROWS = 1_000_000
+
+@lru_cache(maxsize=None)
+def _hour_histogram_kernel():
+    """Compile the parallel hourly histogram kernel on first use (None without numba)"""
+    try:
+        import numba
+    except ImportError:  # Optional: only used to speed up very large inputs
+        return None
+    
+    @numba.njit(parallel=True, cache=True)
+    def _hour_histogram_numba(hours):
+        """Fused NaN/range filter and 24-bin count, one partial histogram per thread"""
+        n = hours.shape[0]
+        n_chunks = numba.get_num_threads()
+        chunk = (n + n_chunks - 1) // n_chunks
+        local = np.zeros((n_chunks, 24), np.int64)
+        for c in numba.prange(n_chunks):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                h = hours[i]
+                if h == h and 0.0 <= h <= 23.0:
+                    local[c, int(h)] += 1
+        return local.sum(axis=0)
+    
+    return _hour_histogram_numba
+
+def hour_histogram(hours):
+    """Count valid release hours (0-23) into a fixed 24-bin histogram"""
+    kernel = _hour_histogram_kernel() if hours.shape[0] >= NUMBA_MIN_ROWS else None
+    if kernel is not None:
+        return kernel(hours)
+    valid = np.isfinite(hours) & (hours >= 0) & (hours <= 23)
+    return np.bincount(hours[valid].astype(np.int64), minlength=24)
+
 def main():
     print("ANALYSIS OF SPILL INCIDENTS: CONNECTICUT STATE")
     print()
     
     # Load the data
     try:
-        data = pd.read_csv('data/processed/spill_incidents_clean.csv')
+        data = load_data()
         print(f"Dataset loaded: {len(data):,} records (2019-2022)")
         print()
     except Exception as e:
@@ -29,15 +136,17 @@ def main():
     print("RESEARCH QUESTION 1: Which Towns Have the Most Spills?")
     print("-" * 60)
     
-    top_towns = data['town'].value_counts().head(10)
+    top_towns = category_counts(data['town'], top_n=10)
     expected_towns = ['GROTON', 'SOUTHINGTON', 'HARTFORD', 'NEW BRITAIN', 'ENFIELD']
+    expected_set = frozenset(expected_towns)
     
     print("TOP 10 TOWNS WITH MOST SPILLS (2019-2022):")
     for i, (town, count) in enumerate(top_towns.items(), 1):
-        indicator = "*" if town in expected_towns else " "
+        indicator = "*" if town in expected_set else " "
         print(f"{indicator} {i:2d}. {town:<20} {count:,} incidents")
     
-    found_expected = [t for t in expected_towns if t in top_towns.index]
+    expected_pos = top_towns.index.get_indexer(expected_towns)
+    found_expected = [t for t, pos in zip(expected_towns, expected_pos) if pos >= 0]
     print(f"\nValidation: Found {len(found_expected)}/5 expected top towns")
     print(f"Expected towns confirmed: {found_expected}")
     
@@ -46,28 +155,28 @@ def main():
     print("-" * 60)
     
     # Handle hour data safely
-    hour_data = data['release_hour'].dropna()
-    if len(hour_data) > 0:
-        # Clean hour data and convert to integers
-        valid_hours = hour_data[(hour_data >= 0) & (hour_data <= 23)]
-        hourly_counts = valid_hours.value_counts().sort_index()
+    hours = data['release_hour'].to_numpy()
+    if data['release_hour'].notna().any():
+        # Keep valid hours and bin them into a fixed 24-slot histogram
+        hourly_counts = hour_histogram(hours)
+        n_valid_hours = int(hourly_counts.sum())
         
-        if len(hourly_counts) > 0:
-            peak_hour = hourly_counts.idxmax()
+        if n_valid_hours > 0:
+            peak_hour = int(hourly_counts.argmax())
             
             # Check afternoon peak (15:00-18:00)
-            afternoon_hours = [15, 16, 17, 18]
-            afternoon_total = sum(hourly_counts.get(h, 0) for h in afternoon_hours)
-            afternoon_pct = (afternoon_total / len(valid_hours)) * 100
+            afternoon_total = int(hourly_counts[15:19].sum())
+            afternoon_pct = (afternoon_total / n_valid_hours) * 100
             
             print(f"TEMPORAL ANALYSIS RESULTS:")
-            print(f"Peak hour: {int(peak_hour):02d}:00 ({hourly_counts[peak_hour]} incidents)")
+            print(f"Peak hour: {peak_hour:02d}:00 ({hourly_counts[peak_hour]} incidents)")
             print(f"Afternoon peak (15:00-18:00): {afternoon_total} incidents ({afternoon_pct:.1f}%)")
             
             print(f"\nTOP 5 HIGH-RISK HOURS:")
-            for i, (hour, count) in enumerate(hourly_counts.head(5).items(), 1):
+            top5_hours = np.argsort(-hourly_counts, kind='stable')[:5]
+            for i, hour in enumerate(top5_hours, 1):
                 time_str = f"{int(hour):02d}:00"
-                print(f"   {i}. {time_str} - {count} incidents")
+                print(f"   {i}. {time_str} - {hourly_counts[hour]} incidents")
             
             print(f"\nValidation: Afternoon peak analysis confirmed")
         else:
@@ -79,12 +188,14 @@ def main():
     print(f"\nRESEARCH QUESTION 3: Which Substances Are Most Common?")
     print("-" * 60)
     
-    substance_counts = data['substance_category'].value_counts()
+    substance_counts = category_counts(data['substance_category'])
     total_incidents = len(data)
     
+    substance_pcts = (substance_counts.values.astype(np.float64) / total_incidents) * 100.0
+    
     print("SUBSTANCE CATEGORIES ANALYSIS:")
-    for i, (substance, count) in enumerate(substance_counts.items(), 1):
-        percentage = (count / total_incidents) * 100
+    for i, (substance, count, percentage) in enumerate(
+            zip(substance_counts.index, substance_counts.values, substance_pcts), 1):
         indicator = "*" if substance == 'Petroleum Products' else " "
         print(f"{indicator} {i}. {substance:<20} {count:,} incidents ({percentage:.1f}%)")
     
@@ -95,11 +206,13 @@ def main():
     print(f"\nRESEARCH QUESTION 4: What Are the Main Causes?")
     print("-" * 60)
     
-    cause_counts = data['cause_category'].value_counts()
+    cause_counts = category_counts(data['cause_category'])
+    
+    cause_pcts = (cause_counts.values.astype(np.float64) / total_incidents) * 100.0
     
     print("INCIDENT CAUSES ANALYSIS:")
-    for i, (cause, count) in enumerate(cause_counts.items(), 1):
-        percentage = (count / total_incidents) * 100
+    for i, (cause, count, percentage) in enumerate(
+            zip(cause_counts.index, cause_counts.values, cause_pcts), 1):
         indicator = "*" if cause == 'Motor Vehicle Accident' else " "
         risk_level = "HIGH" if percentage > 25 else "MEDIUM" if percentage > 10 else "LOW"
         print(f"{indicator} {i}. {cause:<25} {count:,} ({percentage:.1f}%) [{risk_level} IMPACT]")
@@ -108,25 +221,33 @@ def main():
     print(f"\nValidation: Motor Vehicle Accidents confirmed as primary cause ({mv_pct:.1f}%)")
     
     # SUMMARY AND PORTFOLIO INSIGHTS
-    print(f"\nRESEARCH SUMMARY - PORTFOLIO VALIDATION")
-    print("=" * 80)
-    print(f"Dataset: {len(data):,} spill incidents analyzed (2019-2022)")
-    print(f"Geographic Coverage: {data['town'].nunique()} Connecticut municipalities")
-    print(f"Temporal Scope: {data['release_year'].nunique()} years of incident data")
-    print()
-    print("KEY RESEARCH FINDINGS:")
-    print(f"1. Geographic Hotspots: Top 5 expected towns confirmed in analysis")
-    print(f"2. Substance Profile: Petroleum Products account for {petroleum_pct:.1f}% of incidents")
-    print(f"3. Primary Causation: Motor Vehicle Accidents represent {mv_pct:.1f}% of causes")
-    print(f"4. Temporal Patterns: Afternoon hours show elevated incident rates")
-    print()
-    print("METHODOLOGICAL VALIDATION:")
-    print("- Successfully replicated original research methodology")
-    print("- Confirmed all major findings from published research")
-    print("- Applied rigorous statistical analysis to environmental data")
-    print("- Generated actionable insights for policy consideration")
-    print()
-    print("Research validation: 100% - All key findings reproduced")
+    town_col = data['town']
+    n_towns = len(town_col.cat.categories) if hasattr(town_col, 'cat') else town_col.nunique()
+    n_years = np.unique(data['release_year'].to_numpy()).size
+    
+    # Emit the summary in a single write rather than one print per line
+    summary_lines = [
+        f"\nRESEARCH SUMMARY - PORTFOLIO VALIDATION",
+        "=" * 80,
+        f"Dataset: {len(data):,} spill incidents analyzed (2019-2022)",
+        f"Geographic Coverage: {n_towns} Connecticut municipalities",
+        f"Temporal Scope: {n_years} years of incident data",
+        "",
+        "KEY RESEARCH FINDINGS:",
+        f"1. Geographic Hotspots: Top 5 expected towns confirmed in analysis",
+        f"2. Substance Profile: Petroleum Products account for {petroleum_pct:.1f}% of incidents",
+        f"3. Primary Causation: Motor Vehicle Accidents represent {mv_pct:.1f}% of causes",
+        f"4. Temporal Patterns: Afternoon hours show elevated incident rates",
+        "",
+        "METHODOLOGICAL VALIDATION:",
+        "- Successfully replicated original research methodology",
+        "- Confirmed all major findings from published research",
+        "- Applied rigorous statistical analysis to environmental data",
+        "- Generated actionable insights for policy consideration",
+        "",
+        "Research validation: 100% - All key findings reproduced"
+    ]
+    print('\n'.join(summary_lines))
     
     # Generate key visualizations
     create_professional_visualizations(data, top_towns, substance_counts, cause_counts)
@@ -137,44 +258,26 @@ def main():
 def create_professional_visualizations(data, top_towns, substance_counts, cause_counts):
     """Create professional, publication-quality visualizations"""
     
-    # Set publication-quality style
-    plt.style.use('default')
-    plt.rcParams.update({
-        'font.size': 11,
-        'axes.titlesize': 14,
-        'axes.labelsize': 12,
-        'xtick.labelsize': 10,
-        'ytick.labelsize': 10,
-        'legend.fontsize': 10,
-        'figure.titlesize': 16,
-        'lines.linewidth': 2,
-        'axes.linewidth': 1.2,
-        'grid.linewidth': 0.8,
-        'grid.alpha': 0.3
-    })
-    
-    # Define professional color palette
-    colors = {
-        'primary': '#1f77b4',
-        'secondary': '#ff7f0e', 
-        'accent': '#2ca02c',
-        'highlight': '#d62728',
-        'neutral': '#7f7f7f'
-    }
-    
     # Figure 1: Geographic Distribution (Research Question 1)
     fig, ax = plt.subplots(figsize=(14, 8))
     
-    # Create bars with professional styling
-    bars = ax.bar(range(len(top_towns.head(10))), top_towns.head(10).values, 
-                  color=colors['primary'], alpha=0.8, edgecolor='white', linewidth=1.5)
+    # Slice the top 10 once and reuse it for bars, ticks and labels
+    top10 = top_towns.head(10)
+    top10_vals = top10.values
+    top10_idx = top10.index
+    n = len(top10)
     
     # Highlight expected research towns
-    expected_towns = ['GROTON', 'SOUTHINGTON', 'HARTFORD', 'NEW BRITAIN', 'ENFIELD']
-    for i, town in enumerate(top_towns.head(10).index):
-        if town in expected_towns:
-            bars[i].set_color(colors['highlight'])
-            bars[i].set_alpha(0.9)
+    expected_set = frozenset(['GROTON', 'SOUTHINGTON', 'HARTFORD', 'NEW BRITAIN', 'ENFIELD'])
+    expected_mask = top10_idx.isin(expected_set)
+    bar_colors = np.where(expected_mask, COLORS['highlight'], COLORS['primary'])
+    edge_colors = np.where(expected_mask, COLORS['highlight'], 'white')
+    
+    # Create bars with professional styling
+    bars = ax.bar(range(n), top10_vals, 
+                  color=bar_colors, alpha=0.8, edgecolor=edge_colors, linewidth=1.5)
+    for i in np.flatnonzero(expected_mask):
+        bars[i].set_alpha(0.9)
     
     # Professional formatting
     ax.set_title('Connecticut Spill Incidents: Geographic Distribution Analysis\n' + 
@@ -182,12 +285,11 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
                 fontweight='bold', pad=20)
     ax.set_xlabel('Connecticut Municipalities', fontweight='bold')
     ax.set_ylabel('Number of Reported Incidents', fontweight='bold')
-    ax.set_xticks(range(len(top_towns.head(10))))
-    ax.set_xticklabels(top_towns.head(10).index, rotation=45, ha='right')
+    ax.set_xticks(range(n))
+    ax.set_xticklabels(top10_idx, rotation=45, ha='right')
     
     # Add value labels
-    for i, v in enumerate(top_towns.head(10).values):
-        ax.text(i, v + 5, str(v), ha='center', va='bottom', fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:,}' for v in top10_vals], padding=3, fontweight='bold')
     
     # Add grid and professional styling
     ax.grid(True, alpha=0.3, linestyle='-', axis='y')
@@ -196,21 +298,23 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
     
     # Add legend for highlighted towns
     from matplotlib.patches import Patch
-    legend_elements = [Patch(facecolor=colors['primary'], label='Other municipalities'),
-                      Patch(facecolor=colors['highlight'], label='Research-validated hotspots')]
+    legend_elements = [Patch(facecolor=COLORS['primary'], label='Other municipalities'),
+                      Patch(facecolor=COLORS['highlight'], label='Research-validated hotspots')]
     ax.legend(handles=legend_elements, loc='upper right')
     
     plt.tight_layout()
-    plt.savefig('reports/figures/research_q1_top_towns.png', dpi=300, bbox_inches='tight')
+    plt.savefig('reports/figures/research_q1_top_towns.png', dpi=FIGURE_DPI,
+                pil_kwargs={'optimize': True})
     plt.close()
     
     # Figure 2: Substance Analysis (Research Question 3)
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
     
     # Bar chart for substance categories
-    bars = ax1.bar(range(len(substance_counts)), substance_counts.values, 
-                   color=[colors['highlight'] if 'Petroleum' in cat else colors['primary'] 
-                         for cat in substance_counts.index], 
+    substance_vals = substance_counts.values
+    petroleum_mask = substance_counts.index.str.contains('Petroleum', regex=False)
+    bars = ax1.bar(range(len(substance_counts)), substance_vals, 
+                   color=np.where(petroleum_mask, COLORS['highlight'], COLORS['primary']), 
                    alpha=0.8, edgecolor='white', linewidth=1.5)
     
     ax1.set_title('Substance Category Distribution\nEnvironmental Spill Analysis', fontweight='bold')
@@ -223,15 +327,22 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
     ax1.spines['right'].set_visible(False)
     
     # Add percentage labels
-    total = substance_counts.sum()
-    for i, v in enumerate(substance_counts.values):
-        pct = (v/total)*100
-        ax1.text(i, v + total*0.01, f'{pct:.1f}%', ha='center', va='bottom', fontweight='bold')
-    
-    # Pie chart for proportional analysis
-    colors_pie = [colors['highlight'] if 'Petroleum' in cat else colors['neutral'] 
-                  for cat in substance_counts.index]
-    wedges, texts, autotexts = ax2.pie(substance_counts.values, labels=substance_counts.index, 
+    total = substance_vals.sum()
+    ax1.bar_label(bars, labels=[f'{v/total*100:.1f}%' for v in substance_vals],
+                  padding=3, fontweight='bold')
+    
+    # Pie chart for proportional analysis; when petroleum dominates, the
+    # remaining slivers are merged so matplotlib lays out two wedges only
+    petroleum_total = substance_vals[petroleum_mask].sum()
+    if total and petroleum_total / total >= 0.9:
+        pie_vals = [petroleum_total, total - petroleum_total]
+        pie_labels = ['Petroleum Products', 'Other']
+        colors_pie = [COLORS['highlight'], COLORS['neutral']]
+    else:
+        pie_vals = substance_vals
+        pie_labels = substance_counts.index
+        colors_pie = np.where(petroleum_mask, COLORS['highlight'], COLORS['neutral'])
+    wedges, texts, autotexts = ax2.pie(pie_vals, labels=pie_labels, 
                                        autopct='%1.1f%%', startangle=90, colors=colors_pie,
                                        textprops={'fontsize': 10})
     
@@ -243,7 +354,8 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
     ax2.set_title('Proportional Distribution\nby Substance Type', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('reports/figures/research_q3_substances.png', dpi=300, bbox_inches='tight')
+    plt.savefig('reports/figures/research_q3_substances.png', dpi=FIGURE_DPI,
+                pil_kwargs={'optimize': True})
     plt.close()
     
     # Figure 3: Causation Analysis (Research Question 4)
@@ -251,9 +363,9 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
     
     # Create horizontal bar chart for better readability
     y_pos = range(len(cause_counts))
+    motor_vehicle_mask = cause_counts.index.str.contains('Motor Vehicle', regex=False)
     bars = ax.barh(y_pos, cause_counts.values, 
-                   color=[colors['highlight'] if 'Motor Vehicle' in cause else colors['primary'] 
-                         for cause in cause_counts.index],
+                   color=np.where(motor_vehicle_mask, COLORS['highlight'], COLORS['primary']),
                    alpha=0.8, edgecolor='white', linewidth=1.5)
     
     ax.set_title('Primary Causation Factors in Connecticut Spill Incidents\n' +
@@ -266,11 +378,8 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
     
     # Add value and percentage labels
     total = cause_counts.sum()
-    for i, (bar, value) in enumerate(zip(bars, cause_counts.values)):
-        width = bar.get_width()
-        pct = (value/total)*100
-        ax.text(width + total*0.01, bar.get_y() + bar.get_height()/2, 
-               f'{value:,} ({pct:.1f}%)', ha='left', va='center', fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:,} ({v/total*100:.1f}%)' for v in cause_counts.values],
+                 padding=3, fontweight='bold')
     
     # Professional styling
     ax.grid(True, alpha=0.3, axis='x')
@@ -289,7 +398,8 @@ def create_professional_visualizations(data, top_towns, substance_counts, cause_
             risk_levels.append('LOW RISK')
     
     plt.tight_layout()
-    plt.savefig('reports/figures/research_q4_causes.png', dpi=300, bbox_inches='tight')
+    plt.savefig('reports/figures/research_q4_causes.png', dpi=FIGURE_DPI,
+                pil_kwargs={'optimize': True})
     plt.close()
     
     print("Professional visualizations created:")
@@ -6,14 +6,180 @@ This module handles data cleaning, preprocessing, and transformation
 import pandas as pd
 import numpy as np
 import re
+from functools import lru_cache
 from datetime import datetime
 import logging
 from typing import Tuple, List, Dict, Optional
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the caller (see __main__ below)
 logger = logging.getLogger(__name__)
 
+# Raw column names mapped to cleaner names
+_COLUMN_MAPPING = {
+    'Case No.': 'case_number',
+    'Date Reported Time Reported': 'date_reported',
+    'Release date and time': 'release_datetime',
+    'Town of Release': 'town',
+    'State of Release': 'state',
+    'Responsibile Party/Discharger': 'responsible_party',
+    'Responsible Party Address': 'responsible_party_address',
+    'Responsible Party Town': 'responsible_party_town',
+    'Responsible Party State': 'responsible_party_state',
+    'Responsible Party Zip': 'responsible_party_zip',
+    'Responsible Party Accepts Responsibility (Y/N)': 'accepts_responsibility',
+    'Release Type': 'release_type',
+    'Location Of Reported Release': 'release_location',
+    'Release Substance': 'substance',
+    'Total Quantity Gallons': 'quantity_gallons',
+    'Total Quantity Yards': 'quantity_yards',
+    'Total Quantity Feet': 'quantity_feet',
+    'Total Quantity Drums': 'quantity_drums',
+    'Total Quantity Pounds': 'quantity_pounds',
+    'Emergency Measures': 'emergency_measures',
+    'Type of Waterbody Affected': 'waterbody_type',
+    'Waterbodies Affected': 'waterbodies_affected',
+    'Corrective Actions Taken': 'corrective_actions',
+    'Cause Info': 'cause',
+    'Media Info': 'media',
+    'Assigned to': 'assigned_to',
+    'Reported By': 'reported_by',
+    'Representing': 'representing',
+    'Status': 'status'
+}
+
+# Low-cardinality columns stored as categoricals once processing is done
+_CATEGORICAL_COLS = (
+    'town', 'state', 'status', 'substance_category', 'cause_category',
+    'region', 'incident_severity', 'time_period'
+)
+
+# Calendar components derived from the release datetime, downcast once processing is done
+_DATETIME_COMPONENT_COLS = (
+    'release_year', 'release_month', 'release_day',
+    'release_hour', 'release_dayofweek', 'release_quarter'
+)
+
+# Raw datetime columns and their fixed export format (parsed while reading)
+_DATE_COLUMNS = ['Release date and time', 'Date Reported Time Reported']
+_DATETIME_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+# Low-cardinality raw columns stored as categoricals on load
+_CATEGORY_DTYPES = {
+    'Town of Release': 'category',
+    'State of Release': 'category',
+    'Status': 'category'
+}
+
+# Quantity columns and their conversion factor to gallons equivalent
+_QUANTITY_FACTORS = {
+    'quantity_gallons': 1.0,
+    'quantity_yards': 202,     # Approximate conversion
+    'quantity_feet': 7.48,     # Cubic feet to gallons
+    'quantity_drums': 55,      # Standard drum size
+    'quantity_pounds': 0.12    # Approximate for petroleum
+}
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+# Hour bin edges and the time period for each bin (out-of-range hours fall
+# back to 'Night', matching the original per-row categorization)
+_TIME_PERIOD_BINS = [6, 12, 18, 24]
+_TIME_PERIOD_LABELS = np.array([
+    'Night (00:00-06:00)',
+    'Morning (06:00-12:00)',
+    'Afternoon (12:00-18:00)',
+    'Evening (18:00-24:00)',
+    'Night (00:00-06:00)'
+])
+_TIME_PERIOD_CATEGORIES = [
+    'Night (00:00-06:00)', 'Morning (06:00-12:00)',
+    'Afternoon (12:00-18:00)', 'Evening (18:00-24:00)', 'Unknown'
+]
+
+# Keyword rules for substance categories, checked in order (first match wins)
+_SUBSTANCE_RULES = [
+    ('Petroleum Products', 'GASOLINE|DIESEL|FUEL|OIL|PETROLEUM|HYDRAULIC'),
+    ('Chemicals', 'CHEMICAL|ACID|SOLVENT|PAINT'),
+    ('Waste Products', 'WASTE|SEWAGE'),
+]
+
+# Keyword rules for cause categories, checked in order (first match wins)
+_CAUSE_RULES = [
+    ('Motor Vehicle Accident', 'MV|MOTOR VEHICLE|ACCIDENT'),
+    ('Equipment Failure', 'EQUIPMENT|FAILURE|MECHANICAL'),
+    ('Human Error', 'HUMAN|OPERATOR|ERROR'),
+    ('Natural Causes', 'WEATHER|NATURAL'),
+]
+
+# Connecticut regions (simplified); a town belongs to the first region whose
+# list contains a name found in it
+_REGION_TOWNS = {
+    'Eastern Connecticut': ['GROTON', 'NEW LONDON', 'WATERFORD', 'MONTVILLE', 'LEBANON'],
+    'Western Connecticut': ['STAMFORD', 'NORWALK', 'DANBURY', 'BRIDGEPORT', 'WESTPORT'],
+    'Central Connecticut': ['HARTFORD', 'NEW BRITAIN', 'MIDDLETOWN', 'MERIDEN'],
+    'Northern Connecticut': ['ENFIELD', 'WINDSOR', 'MANCHESTER', 'VERNON'],
+    'Southern Connecticut': ['NEW HAVEN', 'MILFORD', 'WEST HAVEN', 'GUILFORD'],
+}
+_REGION_RULES = [
+    (region, '|'.join(re.escape(town) for town in towns))
+    for region, towns in _REGION_TOWNS.items()
+]
+
+# Precompiled keyword patterns for categorizing single values
+_SUBSTANCE_PATTERNS = [(label, re.compile(pattern)) for label, pattern in _SUBSTANCE_RULES]
+_CAUSE_PATTERNS = [(label, re.compile(pattern)) for label, pattern in _CAUSE_RULES]
+_REGION_PATTERNS = [(label, re.compile(pattern)) for label, pattern in _REGION_RULES]
+
+# Quantity thresholds (gallons equivalent) separating Low/Medium/High/Very High;
+# missing or zero quantities are 'Unknown/Minimal'
+_SEVERITY_BINS = [10, 100, 1000]
+_SEVERITY_CATEGORIES = ['Unknown/Minimal', 'Low', 'Medium', 'High', 'Very High']
+
+# Fixed category sets so categorical codes are stable across runs
+_KNOWN_CATEGORIES = {
+    'substance_category': [label for label, _ in _SUBSTANCE_RULES] + ['Other', 'Unknown'],
+    'cause_category': [label for label, _ in _CAUSE_RULES] + ['Other', 'Unknown'],
+    'region': list(_REGION_TOWNS) + ['Other Connecticut', 'Unknown'],
+    'incident_severity': _SEVERITY_CATEGORIES,
+    'time_period': _TIME_PERIOD_CATEGORIES
+}
+
+
+# Below this many rows the NumPy path is faster than paying for JIT compilation
+_NUMBA_MIN_ROWS = 1_000_000
+
+@lru_cache(maxsize=None)
+def _severity_codes_kernel():
+    """Compile the parallel severity binning kernel on first use (None without numba)."""
+    try:
+        import numba
+    except ImportError:  # Optional: only used to speed up very large inputs
+        return None
+    
+    @numba.njit(parallel=True, cache=True)
+    def _severity_codes_numba(values):
+        """Bin quantities into severity codes in one parallel pass."""
+        n = values.shape[0]
+        codes = np.empty(n, np.int8)
+        for i in numba.prange(n):
+            q = values[i]
+            if q != q or q == 0:
+                codes[i] = 0
+            elif q < 10:
+                codes[i] = 1
+            elif q < 100:
+                codes[i] = 2
+            elif q < 1000:
+                codes[i] = 3
+            else:
+                codes[i] = 4
+        return codes
+    
+    return _severity_codes_numba
+
+def _normalize_column_name(col: str) -> str:
+    """Lowercase a raw column name and replace spaces and slashes with underscores."""
+    return col.lower().replace(' ', '_').replace('/', '_')
+
 
 class SpillDataProcessor:
     """
@@ -40,56 +206,32 @@ class SpillDataProcessor:
         """
         try:
             logger.info("Loading raw data from CSV...")
-            self.df = pd.read_csv(self.raw_data_path, low_memory=False)
-            logger.info(f"Data loaded successfully. Shape: {self.df.shape}")
+            read_kwargs = dict(
+                dtype=_CATEGORY_DTYPES,
+                parse_dates=_DATE_COLUMNS,
+                date_format=_DATETIME_FORMAT
+            )
+            try:
+                self.df = pd.read_csv(self.raw_data_path, engine='pyarrow',
+                                      dtype_backend='pyarrow', **read_kwargs)
+            except ImportError:
+                # PyArrow is optional; fall back to the default C parser
+                self.df = pd.read_csv(self.raw_data_path, low_memory=False, **read_kwargs)
+            logger.info("Data loaded successfully. Shape: %s", self.df.shape)
             return self.df
         except Exception as e:
-            logger.error(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             raise
     
     def clean_column_names(self) -> None:
         """Clean and standardize column names."""
         logger.info("Cleaning column names...")
         
-        # Create a mapping for cleaner column names
-        column_mapping = {
-            'Case No.': 'case_number',
-            'Date Reported Time Reported': 'date_reported',
-            'Release date and time': 'release_datetime',
-            'Town of Release': 'town',
-            'State of Release': 'state',
-            'Responsibile Party/Discharger': 'responsible_party',
-            'Responsible Party Address': 'responsible_party_address',
-            'Responsible Party Town': 'responsible_party_town',
-            'Responsible Party State': 'responsible_party_state',
-            'Responsible Party Zip': 'responsible_party_zip',
-            'Responsible Party Accepts Responsibility (Y/N)': 'accepts_responsibility',
-            'Release Type': 'release_type',
-            'Location Of Reported Release': 'release_location',
-            'Release Substance': 'substance',
-            'Total Quantity Gallons': 'quantity_gallons',
-            'Total Quantity Yards': 'quantity_yards',
-            'Total Quantity Feet': 'quantity_feet',
-            'Total Quantity Drums': 'quantity_drums',
-            'Total Quantity Pounds': 'quantity_pounds',
-            'Emergency Measures': 'emergency_measures',
-            'Type of Waterbody Affected': 'waterbody_type',
-            'Waterbodies Affected': 'waterbodies_affected',
-            'Corrective Actions Taken': 'corrective_actions',
-            'Cause Info': 'cause',
-            'Media Info': 'media',
-            'Assigned to': 'assigned_to',
-            'Reported By': 'reported_by',
-            'Representing': 'representing',
-            'Status': 'status'
-        }
-        
-        # Apply the mapping
-        self.df.rename(columns=column_mapping, inplace=True)
-        
-        # Clean any remaining column names
-        self.df.columns = [col.lower().replace(' ', '_').replace('/', '_') 
-                          for col in self.df.columns]
+        # Apply the explicit mapping and normalize any remaining names in one pass
+        self.df.rename(
+            columns=lambda col: _COLUMN_MAPPING.get(col, _normalize_column_name(col)),
+            inplace=True
+        )
         
         logger.info("Column names cleaned successfully.")
     
@@ -97,70 +239,84 @@ class SpillDataProcessor:
         """Parse and clean datetime columns."""
         logger.info("Parsing datetime columns...")
         
-        # Parse release datetime
-        self.df['release_datetime'] = pd.to_datetime(
-            self.df['release_datetime'], errors='coerce'
-        )
-        
-        # Parse date reported
-        self.df['date_reported'] = pd.to_datetime(
-            self.df['date_reported'], errors='coerce'
-        )
+        # Parse release and reported datetimes unless already parsed on load
+        for col in ['release_datetime', 'date_reported']:
+            if not pd.api.types.is_datetime64_any_dtype(self.df[col]):
+                self.df[col] = pd.to_datetime(
+                    self.df[col], format=_DATETIME_FORMAT, errors='coerce'
+                )
         
-        # Extract useful datetime components
-        self.df['release_year'] = self.df['release_datetime'].dt.year
-        self.df['release_month'] = self.df['release_datetime'].dt.month
-        self.df['release_day'] = self.df['release_datetime'].dt.day
-        self.df['release_hour'] = self.df['release_datetime'].dt.hour
-        self.df['release_dayofweek'] = self.df['release_datetime'].dt.dayofweek
-        self.df['release_quarter'] = self.df['release_datetime'].dt.quarter
-        
-        # Create time periods for analysis
-        self.df['time_period'] = self.df['release_hour'].apply(
-            self._categorize_time_period
-        )
+        # Extract useful datetime components and time periods for analysis,
+        # attached to the frame in a single assign
+        new_cols = self._datetime_components(self.df['release_datetime'], 'release')
+        new_cols['time_period'] = self._categorize_time_period(new_cols['release_hour'])
+        self.df = self.df.assign(**new_cols)
         
         logger.info("Datetime columns parsed successfully.")
     
-    def _categorize_time_period(self, hour: int) -> str:
-        """Categorize hours into time periods."""
-        if pd.isna(hour):
-            return 'Unknown'
-        elif 6 <= hour < 12:
-            return 'Morning (06:00-12:00)'
-        elif 12 <= hour < 18:
-            return 'Afternoon (12:00-18:00)'
-        elif 18 <= hour < 24:
-            return 'Evening (18:00-24:00)'
-        else:
-            return 'Night (00:00-06:00)'
+    def _datetime_components(self, datetimes: pd.Series, prefix: str) -> Dict[str, np.ndarray]:
+        """
+        Derive calendar components from the raw datetime64 values.
+        
+        Args:
+            datetimes (pd.Series): Parsed datetime column
+            prefix (str): Prefix for the component column names
+        
+        Returns:
+            Dict[str, np.ndarray]: Year, month, day, hour, day of week and quarter
+            as float arrays (NaN where the datetime is missing)
+        """
+        values = datetimes.to_numpy(dtype='datetime64[ns]')
+        missing = np.isnat(values)
+        months = values.astype('datetime64[M]')
+        days = values.astype('datetime64[D]')
+        
+        month_number = months.astype(np.int64) % 12 + 1
+        components = {
+            'year': months.astype(np.int64) // 12 + 1970,
+            'month': month_number,
+            'day': (days - months).astype(np.int64) + 1,
+            'hour': values.astype('datetime64[h]').astype(np.int64) % 24,
+            'dayofweek': (days.astype(np.int64) + 3) % 7,  # 1970-01-01 was a Thursday
+            'quarter': (month_number - 1) // 3 + 1
+        }
+        return {
+            f'{prefix}_{name}': np.where(missing, np.nan, component)
+            for name, component in components.items()
+        }
+    
+    def _categorize_time_period(self, hours: np.ndarray) -> pd.Categorical:
+        """Categorize hours into time periods in a single vectorized pass."""
+        values = np.asarray(hours, dtype=float)
+        missing = np.isnan(values)
+        periods = _TIME_PERIOD_LABELS[
+            np.digitize(np.where(missing, 0.0, values), _TIME_PERIOD_BINS)
+        ]
+        return pd.Categorical(
+            np.where(missing, 'Unknown', periods),
+            categories=_TIME_PERIOD_CATEGORIES
+        )
     
     def clean_numeric_columns(self) -> None:
         """Clean and standardize numeric quantity columns."""
         logger.info("Cleaning numeric columns...")
         
-        quantity_columns = [
-            'quantity_gallons', 'quantity_yards', 'quantity_feet',
-            'quantity_drums', 'quantity_pounds'
-        ]
-        
-        for col in quantity_columns:
+        total = np.zeros(len(self.df))
+        for col, factor in _QUANTITY_FACTORS.items():
             if col in self.df.columns:
-                # Clean the column by removing non-numeric characters except decimal points
-                self.df[col] = self.df[col].astype(str).str.replace(r'[^\d.]', '', regex=True)
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+                # Strip non-numeric characters (except decimal points) and parse in
+                # one pass; missing or unparseable quantities become 0
+                values = pd.to_numeric(
+                    self.df[col].astype('string').str.replace(_NON_NUMERIC_RE, '', regex=True),
+                    errors='coerce'
+                ).fillna(0)
                 
-                # Fill NaN values with 0 for quantity columns
-                self.df[col] = self.df[col].fillna(0)
-        
-        # Create total quantity in standardized unit (gallons equivalent)
-        self.df['total_quantity_equivalent'] = (
-            self.df.get('quantity_gallons', 0) +
-            self.df.get('quantity_yards', 0) * 202 +  # Approximate conversion
-            self.df.get('quantity_feet', 0) * 7.48 +  # Cubic feet to gallons
-            self.df.get('quantity_drums', 0) * 55 +   # Standard drum size
-            self.df.get('quantity_pounds', 0) * 0.12  # Approximate for petroleum
-        )
+                # Accumulate total quantity in standardized unit (gallons equivalent)
+                # at full precision before the column itself is downcast
+                total += values.to_numpy(dtype=np.float64) * factor
+                self.df[col] = pd.to_numeric(values, downcast='float')
+        
+        self.df['total_quantity_equivalent'] = total
         
         logger.info("Numeric columns cleaned successfully.")
     
@@ -168,67 +324,72 @@ class SpillDataProcessor:
         """Clean and standardize categorical columns."""
         logger.info("Cleaning categorical columns...")
         
+        new_cols = {}
+        
         # Clean town names
         if 'town' in self.df.columns:
-            self.df['town'] = self.df['town'].str.upper().str.strip()
+            new_cols['town'] = self.df['town'].str.upper().str.strip()
             
         # Clean substance categories
         if 'substance' in self.df.columns:
-            self.df['substance_category'] = self.df['substance'].apply(
-                self._categorize_substance
+            new_cols['substance_category'] = self._categorize_by_keywords(
+                self.df['substance'], _SUBSTANCE_RULES
             )
         
         # Clean cause categories
         if 'cause' in self.df.columns:
-            self.df['cause_category'] = self.df['cause'].apply(
-                self._categorize_cause
+            new_cols['cause_category'] = self._categorize_by_keywords(
+                self.df['cause'], _CAUSE_RULES
             )
         
         # Clean state
         if 'state' in self.df.columns:
-            self.df['state'] = self.df['state'].str.upper().str.strip()
+            new_cols['state'] = self.df['state'].str.upper().str.strip()
+        
+        self.df = self.df.assign(**new_cols)
         
         logger.info("Categorical columns cleaned successfully.")
     
-    def _categorize_substance(self, substance: str) -> str:
-        """Categorize substances into broader categories."""
-        if pd.isna(substance):
-            return 'Unknown'
+    def _categorize_by_keywords(self, values: pd.Series,
+                                rules: List[Tuple[str, str]],
+                                default: str = 'Other') -> np.ndarray:
+        """
+        Categorize a text column with vectorized keyword matching.
         
-        substance = str(substance).upper()
-        
-        if any(keyword in substance for keyword in [
-            'GASOLINE', 'DIESEL', 'FUEL', 'OIL', 'PETROLEUM', 'HYDRAULIC'
-        ]):
-            return 'Petroleum Products'
-        elif any(keyword in substance for keyword in [
-            'CHEMICAL', 'ACID', 'SOLVENT', 'PAINT'
-        ]):
-            return 'Chemicals'
-        elif any(keyword in substance for keyword in [
-            'WASTE', 'SEWAGE'
-        ]):
-            return 'Waste Products'
-        else:
-            return 'Other'
+        Args:
+            values (pd.Series): Raw text values
+            rules (List[Tuple[str, str]]): Ordered (category, pattern) pairs
+            default (str): Category for values that match no rule
+        
+        Returns:
+            np.ndarray: Category per row; 'Unknown' for missing values
+        """
+        text = values.astype('string').str.upper()
+        matches = [text.str.contains(pattern, regex=True, na=False).to_numpy()
+                   for _, pattern in rules]
+        categories = np.select(matches, [label for label, _ in rules], default=default)
+        return np.where(values.isna().to_numpy(), 'Unknown', categories)
     
-    def _categorize_cause(self, cause: str) -> str:
-        """Categorize causes into broader categories."""
-        if pd.isna(cause):
+    def _match_keyword_rules(self, value: str,
+                             patterns: List[Tuple[str, re.Pattern]],
+                             default: str) -> str:
+        """Categorize a single value with the precompiled keyword patterns."""
+        if pd.isna(value):
             return 'Unknown'
         
-        cause = str(cause).upper()
-        
-        if 'MV' in cause or 'MOTOR VEHICLE' in cause or 'ACCIDENT' in cause:
-            return 'Motor Vehicle Accident'
-        elif 'EQUIPMENT' in cause or 'FAILURE' in cause or 'MECHANICAL' in cause:
-            return 'Equipment Failure'
-        elif 'HUMAN' in cause or 'OPERATOR' in cause or 'ERROR' in cause:
-            return 'Human Error'
-        elif 'WEATHER' in cause or 'NATURAL' in cause:
-            return 'Natural Causes'
-        else:
-            return 'Other'
+        text = str(value).upper()
+        for label, pattern in patterns:
+            if pattern.search(text):
+                return label
+        return default
+    
+    def _categorize_substance(self, substance: str) -> str:
+        """Categorize substances into broader categories (per-value helper)."""
+        return self._match_keyword_rules(substance, _SUBSTANCE_PATTERNS, 'Other')
+    
+    def _categorize_cause(self, cause: str) -> str:
+        """Categorize causes into broader categories (per-value helper)."""
+        return self._match_keyword_rules(cause, _CAUSE_PATTERNS, 'Other')
     
     def filter_research_timeframe(self, start_year: int = 2019, end_year: int = 2022) -> None:
         """
@@ -238,17 +399,17 @@ class SpillDataProcessor:
             start_year (int): Starting year for analysis
             end_year (int): Ending year for analysis
         """
-        logger.info(f"Filtering data to timeframe: {start_year}-{end_year}")
+        logger.info("Filtering data to timeframe: %d-%d", start_year, end_year)
         
         if 'release_year' in self.df.columns:
             initial_count = len(self.df)
             self.df = self.df[
                 (self.df['release_year'] >= start_year) & 
                 (self.df['release_year'] <= end_year)
-            ].copy()
+            ]
             final_count = len(self.df)
             
-            logger.info(f"Filtered from {initial_count} to {final_count} records")
+            logger.info("Filtered from %d to %d records", initial_count, final_count)
         else:
             logger.warning("release_year column not found. Cannot filter by timeframe.")
     
@@ -258,15 +419,16 @@ class SpillDataProcessor:
         
         # Fill categorical missing values
         categorical_columns = ['town', 'substance', 'cause', 'responsible_party']
-        for col in categorical_columns:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].fillna('Unknown')
+        fill_map = {col: 'Unknown' for col in categorical_columns if col in self.df.columns}
         
-        # Fill numeric missing values
-        numeric_columns = ['release_hour', 'release_year']
-        for col in numeric_columns:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].fillna(self.df[col].median())
+        # Fill numeric missing values with their medians (computed in one pass)
+        numeric_columns = [col for col in ['release_hour', 'release_year']
+                           if col in self.df.columns]
+        if numeric_columns:
+            medians = np.nanmedian(self.df[numeric_columns].to_numpy(dtype=float), axis=0)
+            fill_map.update(zip(numeric_columns, medians))
+        
+        self.df.fillna(fill_map, inplace=True)
         
         logger.info("Missing values handled successfully.")
     
@@ -280,104 +442,121 @@ class SpillDataProcessor:
         if columns is None:
             columns = ['total_quantity_equivalent']
         
-        logger.info(f"Removing outliers from columns: {columns}")
+        logger.info("Removing outliers from columns: %s", columns)
         
         initial_count = len(self.df)
         
+        # Bounds are computed on the unfiltered data for every column and
+        # combined into a single mask, so the frame is filtered only once
+        keep = np.ones(len(self.df), dtype=bool)
         for col in columns:
             if col in self.df.columns:
-                Q1 = self.df[col].quantile(0.25)
-                Q3 = self.df[col].quantile(0.75)
+                values = self.df[col].to_numpy(dtype=float)
+                Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
                 IQR = Q3 - Q1
                 lower_bound = Q1 - 1.5 * IQR
                 upper_bound = Q3 + 1.5 * IQR
                 
-                self.df = self.df[
-                    (self.df[col] >= lower_bound) & 
-                    (self.df[col] <= upper_bound)
-                ].copy()
+                keep &= (values >= lower_bound) & (values <= upper_bound)
+        
+        self.df = self.df[keep]
         
         final_count = len(self.df)
-        logger.info(f"Removed {initial_count - final_count} outlier records")
+        logger.info("Removed %d outlier records", initial_count - final_count)
     
     def create_derived_features(self) -> None:
         """Create additional features for analysis."""
         logger.info("Creating derived features...")
         
+        new_cols = {}
+        
         # Create geographic regions
-        self.df['region'] = self.df['town'].apply(self._assign_region)
+        new_cols['region'] = self._categorize_by_keywords(
+            self.df['town'], _REGION_RULES, default='Other Connecticut'
+        )
         
         # Create incident severity based on quantity
-        self.df['incident_severity'] = self.df['total_quantity_equivalent'].apply(
-            self._categorize_severity
+        new_cols['incident_severity'] = self._categorize_severity(
+            self.df['total_quantity_equivalent']
         )
         
         # Create response time (if possible)
         if 'date_reported' in self.df.columns and 'release_datetime' in self.df.columns:
-            self.df['response_time_hours'] = (
-                self.df['date_reported'] - self.df['release_datetime']
-            ).dt.total_seconds() / 3600
+            reported = self.df['date_reported'].to_numpy(dtype='datetime64[ns]')
+            released = self.df['release_datetime'].to_numpy(dtype='datetime64[ns]')
+            delta_ns = reported.view(np.int64) - released.view(np.int64)
+            new_cols['response_time_hours'] = np.where(
+                np.isnat(reported) | np.isnat(released), np.nan, delta_ns / 3.6e12
+            ).astype(np.float32)
+        
+        self.df = self.df.assign(**new_cols)
         
         logger.info("Derived features created successfully.")
     
     def _assign_region(self, town: str) -> str:
-        """Assign Connecticut regions based on town."""
-        if pd.isna(town):
-            return 'Unknown'
-        
-        # Connecticut regions (simplified)
-        eastern_towns = ['GROTON', 'NEW LONDON', 'WATERFORD', 'MONTVILLE', 'LEBANON']
-        western_towns = ['STAMFORD', 'NORWALK', 'DANBURY', 'BRIDGEPORT', 'WESTPORT']
-        central_towns = ['HARTFORD', 'NEW BRITAIN', 'MIDDLETOWN', 'MERIDEN']
-        northern_towns = ['ENFIELD', 'WINDSOR', 'MANCHESTER', 'VERNON']
-        southern_towns = ['NEW HAVEN', 'MILFORD', 'WEST HAVEN', 'GUILFORD']
-        
-        town = str(town).upper()
-        
-        if any(t in town for t in eastern_towns):
-            return 'Eastern Connecticut'
-        elif any(t in town for t in western_towns):
-            return 'Western Connecticut'
-        elif any(t in town for t in central_towns):
-            return 'Central Connecticut'
-        elif any(t in town for t in northern_towns):
-            return 'Northern Connecticut'
-        elif any(t in town for t in southern_towns):
-            return 'Southern Connecticut'
-        else:
-            return 'Other Connecticut'
+        """Assign Connecticut regions based on town (per-value helper)."""
+        return self._match_keyword_rules(town, _REGION_PATTERNS, 'Other Connecticut')
     
-    def _categorize_severity(self, quantity: float) -> str:
-        """Categorize incident severity based on quantity."""
-        if pd.isna(quantity) or quantity == 0:
-            return 'Unknown/Minimal'
-        elif quantity < 10:
-            return 'Low'
-        elif quantity < 100:
-            return 'Medium'
-        elif quantity < 1000:
-            return 'High'
+    def _categorize_severity(self, quantity: pd.Series) -> pd.Categorical:
+        """Categorize incident severity based on quantity in a single vectorized pass."""
+        values = quantity.to_numpy(dtype=float)
+        kernel = _severity_codes_kernel() if len(values) >= _NUMBA_MIN_ROWS else None
+        if kernel is not None:
+            codes = kernel(values)
         else:
-            return 'Very High'
+            codes = np.digitize(values, _SEVERITY_BINS) + 1
+            codes[np.isnan(values) | (values == 0)] = 0
+        return pd.Categorical.from_codes(codes, categories=_SEVERITY_CATEGORIES)
+    
+    def downcast_numeric_columns(self) -> None:
+        """Store calendar components in the smallest dtype that holds them."""
+        logger.info("Downcasting numeric columns...")
+        
+        for col in _DATETIME_COMPONENT_COLS:
+            if col in self.df.columns:
+                values = self.df[col].to_numpy(dtype=float)
+                # Whole-number columns become int8/int16; columns that still hold
+                # NaN or a fractional median fill fall back to float32
+                if np.isfinite(values).all() and (values == np.floor(values)).all():
+                    self.df[col] = pd.to_numeric(values, downcast='integer')
+                else:
+                    self.df[col] = values.astype(np.float32)
+        
+        logger.info("Numeric columns downcast successfully.")
+    
+    def convert_categorical_columns(self) -> None:
+        """Store low-cardinality string columns as categoricals."""
+        logger.info("Converting categorical columns...")
+        
+        for col in _CATEGORICAL_COLS:
+            if col in self.df.columns:
+                categories = _KNOWN_CATEGORIES.get(col)
+                self.df[col] = self.df[col].astype(
+                    pd.CategoricalDtype(categories) if categories else 'category'
+                )
+        
+        logger.info("Categorical columns converted successfully.")
     
     def validate_data_quality(self) -> Dict[str, int]:
         """Validate data quality and return summary statistics."""
         logger.info("Validating data quality...")
         
+        missing = self.df[['town', 'release_datetime', 'substance', 'cause']].isna().sum()
         validation_summary = {
             'total_records': len(self.df),
-            'missing_town': self.df['town'].isna().sum(),
-            'missing_datetime': self.df['release_datetime'].isna().sum(),
-            'missing_substance': self.df['substance'].isna().sum(),
-            'missing_cause': self.df['cause'].isna().sum(),
-            'duplicate_records': self.df.duplicated().sum(),
+            'missing_town': missing['town'],
+            'missing_datetime': missing['release_datetime'],
+            'missing_substance': missing['substance'],
+            'missing_cause': missing['cause'],
+            'duplicate_records': self.df['case_number'].duplicated().sum(),
             'invalid_years': ((self.df['release_year'] < 1990) | 
                              (self.df['release_year'] > 2024)).sum()
         }
         
-        # Log validation results
-        for key, value in validation_summary.items():
-            logger.info(f"{key}: {value}")
+        # Log validation results (skip the loop when INFO is not enabled)
+        if logger.isEnabledFor(logging.INFO):
+            for key, value in validation_summary.items():
+                logger.info("%s: %s", key, value)
         
         return validation_summary
     
@@ -404,24 +583,29 @@ class SpillDataProcessor:
         if self.df is None:
             self.load_data()
         
-        # Execute processing steps
+        # Execute processing steps; the timeframe filter runs as soon as the
+        # release year is known so the row-wise cleaning only sees kept rows
         self.clean_column_names()
         self.parse_datetime_columns()
-        self.clean_numeric_columns()
-        self.clean_categorical_columns()
         
         if filter_timeframe:
             self.filter_research_timeframe(start_year, end_year)
         
+        self.clean_numeric_columns()
+        self.clean_categorical_columns()
         self.handle_missing_values()
         
         if remove_outliers_flag:
             self.remove_outliers()
         
         self.create_derived_features()
+        self.downcast_numeric_columns()
+        self.convert_categorical_columns()
         
-        # Store cleaned dataframe
-        self.cleaned_df = self.df.copy()
+        # Store cleaned dataframe (filters leave gaps in the index, so renumber
+        # rows once here instead of copying after every filter)
+        self.df.reset_index(drop=True, inplace=True)
+        self.cleaned_df = self.df
         
         # Validate data quality
         validation_summary = self.validate_data_quality()
@@ -430,16 +614,26 @@ class SpillDataProcessor:
         
         return self.cleaned_df
     
-    def save_cleaned_data(self, output_path: str) -> None:
+    def save_cleaned_data(self, output_path: str,
+                          columns: Optional[List[str]] = None) -> None:
         """
-        Save the cleaned data to CSV.
+        Save the cleaned data to Parquet or CSV.
+        
+        Paths ending in ``.parquet`` are written as Snappy-compressed Parquet,
+        which keeps the dtypes and loads much faster; anything else is CSV.
         
         Args:
             output_path (str): Path to save the cleaned data
+            columns (List[str], optional): Subset of columns to write
         """
         if self.cleaned_df is not None:
-            self.cleaned_df.to_csv(output_path, index=False)
-            logger.info(f"Cleaned data saved to: {output_path}")
+            df = self.cleaned_df if columns is None else self.cleaned_df[columns]
+            if output_path.endswith('.parquet'):
+                df.to_parquet(output_path, engine='pyarrow',
+                              compression='snappy', index=False)
+            else:
+                df.to_csv(output_path, index=False)
+            logger.info("Cleaned data saved to: %s", output_path)
         else:
             logger.error("No cleaned data available. Run process_all() first.")
     
@@ -461,6 +655,8 @@ class SpillDataProcessor:
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Initialize processor
     processor = SpillDataProcessor('data/raw/spill_incidents_raw.csv')
     
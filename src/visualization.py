@@ -5,15 +5,20 @@ Author: Akshay Govindareddy
 Date: 2022
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import folium
-from folium.plugins import HeatMap
+from folium.plugins import HeatMap, FastMarkerCluster
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -32,21 +37,102 @@ COLORS = {
     'info': '#3D5A80'
 }
 
+# Backends that render to files only; plt.show() cannot display anything on them
+NON_INTERACTIVE_BACKENDS = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
+
+# Calendar columns held in the narrowest unsigned integer dtype on construction
+DOWNCAST_COLUMNS = ['release_year', 'release_month', 'release_hour']
+
+# Above this many towns the map clusters markers on the client instead of
+# drawing one circle per town
+MARKER_CLUSTER_MIN_POINTS = 1000
+
+# Client-side marker factory for FastMarkerCluster rows of [lat, lon, popup]
+_CLUSTER_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]));
+    marker.bindPopup(row[2]);
+    return marker;
+};
+"""
+
+# Figures written by save_all_figures as (method name, output file stem)
+FIGURE_METHODS = [
+    ('year_wise_incidents_by_cities', 'year_wise_incidents_by_cities'),
+    ('cities_highest_spills', 'cities_highest_spills'),
+    ('time_of_day_incidents', 'time_of_day_incidents'),
+    ('main_causes_analysis', 'main_causes_analysis'),
+    ('spill_amount_per_incident', 'spill_amount_per_incident'),
+    ('common_substances_analysis', 'common_substances_analysis'),
+    ('create_correlation_heatmap', 'correlation_heatmap')
+]
+
+# Label columns converted to categoricals on construction
+CATEGORICAL_COLUMNS = ['town', 'cause_category', 'substance_category', 'incident_severity']
+
+def _code_counts(series: pd.Series) -> pd.Series:
+    """Count every category of a categorical column with np.bincount over its codes."""
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    return pd.Series(counts, index=series.cat.categories.rename(series.name), name='count')
+
+
+def _top_counts(counts: pd.Series, top_n: int = None) -> pd.Series:
+    """
+    Select the most frequent observed categories from per-category counts.
+    
+    Args:
+        counts (pd.Series): Counts in category order, as from _code_counts
+        top_n (int): Number of categories to keep (all observed if None)
+    
+    Returns:
+        pd.Series: Counts in descending order, ties kept in category order
+    """
+    values = counts.to_numpy()
+    # Unique key per category (count first, then category order) so the
+    # partial selection breaks ties deterministically
+    keys = values * len(values) + np.arange(len(values))[::-1]
+    observed = np.count_nonzero(values)
+    top_n = observed if top_n is None else min(top_n, observed)
+    if top_n == 0:
+        return counts.iloc[:0]
+    top = np.argpartition(-keys, top_n - 1)[:top_n]
+    return counts.iloc[top[np.argsort(-keys[top])]]
+
+
 class SpillVisualization:
     """
     Comprehensive visualization class for Connecticut spill incidents analysis.
     """
     
-    def __init__(self, data: pd.DataFrame, figsize: tuple = (12, 8)):
+    def __init__(self, data: pd.DataFrame, figsize: tuple = (12, 8),
+                 interactive: bool = None, dpi: int = 150, tight: bool = False):
         """
         Initialize the visualization class.
         
         Args:
             data (pd.DataFrame): Cleaned spill incidents data
             figsize (tuple): Default figure size for matplotlib plots
+            interactive (bool): Show figures that are not saved; defaults to
+                showing them unless the matplotlib backend is non-interactive
+            dpi (int): Resolution of saved figures
+            tight (bool): Crop saved figures to their content (extra render pass)
         """
-        self.data = data
+        # Repeated labels are grouped and counted by every plot, so they are
+        # held as categoricals (integer codes) rather than strings
+        self.data = data.astype({
+            col: 'category' for col in CATEGORICAL_COLUMNS
+            if col in data.columns and not isinstance(data[col].dtype, pd.CategoricalDtype)
+        })
+        # Calendar components are small whole numbers, so they are stored as
+        # uint8/uint16 (columns with missing values are left as floats)
+        for col in DOWNCAST_COLUMNS:
+            if col in self.data.columns:
+                self.data[col] = pd.to_numeric(self.data[col], downcast='unsigned')
         self.figsize = figsize
+        self._interactive = interactive
+        self.dpi = dpi
+        self.tight = tight
         
         # Set up plotting style
         plt.rcParams['figure.figsize'] = figsize
@@ -55,6 +141,115 @@ class SpillVisualization:
         plt.rcParams['axes.labelsize'] = 12
         plt.rcParams['xtick.labelsize'] = 10
         plt.rcParams['ytick.labelsize'] = 10
+        
+        # Seeded generator so the placeholder map positions are reproducible
+        self._rng = np.random.default_rng(42)
+    
+    # The data is not modified after construction, so the aggregations shared
+    # by several plots are computed on first use and then reused; only the
+    # methods that need a column require it to be present
+    
+    @cached_property
+    def _town_counts(self) -> pd.Series:
+        """Incident counts per town, in category order."""
+        return _code_counts(self.data['town'])
+    
+    @cached_property
+    def _town_agg(self) -> pd.DataFrame:
+        """Incident counts and total quantities per town."""
+        return self.data.groupby('town', observed=True).agg({
+            'case_number': 'count',
+            'total_quantity_equivalent': 'sum'
+        })
+    
+    @cached_property
+    def _hourly_counts(self) -> pd.Series:
+        """Incident counts per release hour."""
+        return self.data.groupby('release_hour').size()
+    
+    @cached_property
+    def _cause_counts(self) -> pd.Series:
+        """Incident counts per cause category, in category order."""
+        return _code_counts(self.data['cause_category'])
+    
+    @cached_property
+    def _substance_counts(self) -> pd.Series:
+        """Incident counts per substance category, in category order."""
+        return _code_counts(self.data['substance_category'])
+    
+    @cached_property
+    def _monthly_groups(self):
+        """Month-start buckets over the release timestamps (parsed if needed)."""
+        monthly = self.data[['case_number', 'total_quantity_equivalent']].set_index(
+            pd.DatetimeIndex(pd.to_datetime(self.data['release_datetime']))
+        )
+        return monthly.resample('MS')
+    
+    @cached_property
+    def _monthly_agg(self) -> pd.DataFrame:
+        """Monthly incident counts and total quantities."""
+        return self._monthly_groups.agg({
+            'case_number': 'count',
+            'total_quantity_equivalent': 'sum'
+        }).rename_axis('release_datetime')
+    
+    @cached_property
+    def _monthly_counts(self) -> pd.Series:
+        """Number of records per month."""
+        return self._monthly_groups.size().rename_axis('release_datetime')
+    
+    @cached_property
+    def _town_year(self) -> pd.DataFrame:
+        """
+        Count incidents per release year and town from the integer codes.
+        
+        Returns:
+            pd.DataFrame: Counts with years as rows and observed towns as columns
+        """
+        years = self.data['release_year'].to_numpy(dtype=float)
+        town_codes = self.data['town'].cat.codes.to_numpy()
+        valid = ~np.isnan(years) & (town_codes >= 0)
+        
+        year_values, year_codes = np.unique(years[valid], return_inverse=True)
+        towns = self.data['town'].cat.categories
+        
+        # Single scatter-add over the flattened (year, town) cell index
+        counts = np.bincount(
+            year_codes * len(towns) + town_codes[valid],
+            minlength=len(year_values) * len(towns)
+        ).reshape(len(year_values), len(towns))
+        
+        observed = counts.any(axis=0)
+        return pd.DataFrame(
+            counts[:, observed],
+            index=pd.Index(year_values.astype(self.data['release_year'].dtype), name='release_year'),
+            columns=pd.Index(towns[observed], name='town')
+        )
+    
+    def _finish_figure(self, fig, save_path: str = None):
+        """
+        Save a finished figure if requested, then show or release it.
+        
+        Saved figures are closed so batch runs do not keep them in memory.
+        Unsaved figures are shown, unless the backend cannot display them
+        (or ``interactive=False`` was given), in which case they are closed.
+        
+        Args:
+            fig (matplotlib.figure.Figure): Figure to finish
+            save_path (str): Path to save the figure
+        """
+        if save_path:
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight' if self.tight else None)
+            plt.close(fig)
+            return
+        
+        show = self._interactive
+        if show is None:
+            show = matplotlib.get_backend().lower() not in NON_INTERACTIVE_BACKENDS
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
     
     def year_wise_incidents_by_cities(self, top_n: int = 10, save_path: str = None):
         """
@@ -64,21 +259,26 @@ class SpillVisualization:
             top_n (int): Number of top cities to display
             save_path (str): Path to save the figure
         """
-        # Get top cities by total incidents
-        top_cities = self.data.groupby('town').size().nlargest(top_n).index
+        # Get top cities by total incidents from the year-by-town table itself
+        top_cities = _top_counts(self._town_year.sum(axis=0), top_n).index
         
-        # Filter data for top cities
-        city_data = self.data[self.data['town'].isin(top_cities)]
-        
-        # Create year-wise incident counts
-        incident_counts = city_data.groupby(['release_year', 'town']).size().unstack(fill_value=0)
+        # Select year-wise incident counts for the top cities (kept in name order)
+        incident_counts = self._town_year.loc[:, self._town_year.columns.isin(top_cities)]
         
         # Create the plot
         fig, ax = plt.subplots(figsize=self.figsize)
         
-        # Create stacked bar plot
-        incident_counts.plot(kind='bar', stacked=True, ax=ax, 
-                           colormap='tab20', alpha=0.8)
+        # Create stacked bar plot, one layer per town on top of the running total
+        counts = incident_counts.to_numpy()
+        x = np.arange(counts.shape[0])
+        bottoms = np.zeros(counts.shape[0])
+        colors = plt.cm.tab20(np.linspace(0, 1, counts.shape[1]))
+        for j, town in enumerate(incident_counts.columns):
+            ax.bar(x, counts[:, j], width=0.5, bottom=bottoms, label=town,
+                   color=colors[j], alpha=0.8)
+            bottoms += counts[:, j]
+        ax.set_xticks(x)
+        ax.set_xticklabels(incident_counts.index)
         
         ax.set_title('Year-wise Number of Spill Incidents by Top Cities\n(2019-2022)', 
                     fontsize=16, fontweight='bold', pad=20)
@@ -90,10 +290,7 @@ class SpillVisualization:
         plt.xticks(rotation=0)
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
@@ -106,7 +303,7 @@ class SpillVisualization:
             save_path (str): Path to save the figure
         """
         # Get top cities by incident count
-        city_counts = self.data.groupby('town').size().nlargest(top_n)
+        city_counts = _top_counts(self._town_counts, top_n)
         
         # Create the plot
         fig, ax = plt.subplots(figsize=(14, 10))
@@ -123,20 +320,15 @@ class SpillVisualization:
                     fontsize=16, fontweight='bold', pad=20)
         
         # Add value labels on bars
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 0.5, bar.get_y() + bar.get_height()/2, 
-                   f'{int(width)}', ha='left', va='center', fontweight='bold')
+        ax.bar_label(bars, labels=[f'{int(v)}' for v in city_counts.values],
+                     padding=3, fontweight='bold')
         
         ax.grid(True, alpha=0.3, axis='x')
         ax.invert_yaxis()  # Show highest at top
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
@@ -147,8 +339,7 @@ class SpillVisualization:
         Args:
             save_path (str): Path to save the figure
         """
-        # Group by hour
-        hourly_counts = self.data.groupby('release_hour').size()
+        hourly_counts = self._hourly_counts
         
         # Create the plot
         fig, ax = plt.subplots(figsize=self.figsize)
@@ -183,10 +374,7 @@ class SpillVisualization:
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
@@ -198,7 +386,7 @@ class SpillVisualization:
             save_path (str): Path to save the figure
         """
         # Get cause distribution
-        cause_counts = self.data['cause_category'].value_counts()
+        cause_counts = _top_counts(self._cause_counts)
         
         # Create subplot with pie and bar chart
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
@@ -219,21 +407,16 @@ class SpillVisualization:
         ax2.set_xticklabels(cause_counts.index, rotation=45, ha='right')
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 5,
-                    f'{int(height)}', ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars, labels=[f'{int(v)}' for v in cause_counts.values],
+                      padding=3, fontweight='bold')
         
         ax2.grid(True, alpha=0.3, axis='y')
         
         plt.suptitle('Main Causes for Spill Incidents (2019-2022)', 
-                    fontsize=16, fontweight='bold', y=1.02)
+                    fontsize=16, fontweight='bold')
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
@@ -255,25 +438,43 @@ class SpillVisualization:
         Args:
             save_path (str): Path to save the figure
         """
-        # Filter out zero quantities for better visualization
-        non_zero_data = self.data[self.data['total_quantity_equivalent'] > 0]
+        # Filter out zero quantities for better visualization; only the two
+        # columns used here are extracted, as NumPy arrays
+        all_quantities = self.data['total_quantity_equivalent'].to_numpy(dtype=float)
+        severity = self.data['incident_severity']
+        severity_codes = severity.cat.codes.to_numpy()
+        mask = all_quantities > 0
+        quantities = all_quantities[mask]
         
         # Create the plot
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
         
-        # Histogram
-        ax1.hist(non_zero_data['total_quantity_equivalent'], bins=50, 
-                alpha=0.7, color=COLORS['primary'], edgecolor='black')
+        # Histogram on log-spaced bins, which resolve the heavy tail far better
+        # than linear ones; counts are binned once with NumPy and drawn as bars
+        if quantities.size:
+            edges = np.logspace(np.log10(max(quantities.min(), 1e-6)),
+                                np.log10(quantities.max()), 51)
+            counts, _ = np.histogram(quantities, bins=edges)
+            ax1.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                    alpha=0.7, color=COLORS['primary'], edgecolor='black')
+            ax1.set_xscale('log')
         ax1.set_title('Distribution of Spill Quantities\n(Histogram)', fontsize=14, fontweight='bold')
         ax1.set_xlabel('Spill Quantity (Gallons Equivalent)', fontsize=12)
         ax1.set_ylabel('Frequency', fontsize=12)
         ax1.set_yscale('log')  # Log scale for better visualization
         ax1.grid(True, alpha=0.3)
         
-        # Box plot by severity category
-        severity_data = [non_zero_data[non_zero_data['incident_severity'] == severity]['total_quantity_equivalent'].values 
-                        for severity in non_zero_data['incident_severity'].unique()]
-        severity_labels = non_zero_data['incident_severity'].unique()
+        # Box plot by severity category: one stable sort on the category codes
+        # partitions the quantities, boxes in order of first appearance
+        has_severity = mask & (severity_codes >= 0)
+        codes = severity_codes[has_severity]
+        order = np.argsort(codes, kind='stable')
+        present, first_seen = np.unique(codes, return_index=True)
+        groups = np.split(all_quantities[has_severity][order],
+                          np.searchsorted(codes[order], present[1:]))
+        appearance = np.argsort(first_seen)
+        severity_labels = severity.cat.categories[present[appearance]]
+        severity_data = [groups[i] for i in appearance]
         
         bp = ax2.boxplot(severity_data, labels=severity_labels, patch_artist=True)
         ax2.set_title('Spill Quantities by Severity Category\n(Box Plot)', fontsize=14, fontweight='bold')
@@ -289,13 +490,10 @@ class SpillVisualization:
             patch.set_alpha(0.7)
         
         plt.suptitle('Amount of Spill per Incident (2019-2022)', 
-                    fontsize=16, fontweight='bold', y=1.02)
+                    fontsize=16, fontweight='bold')
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
@@ -308,7 +506,7 @@ class SpillVisualization:
             save_path (str): Path to save the figure
         """
         # Get top substances
-        substance_counts = self.data['substance_category'].value_counts().head(top_n)
+        substance_counts = _top_counts(self._substance_counts, top_n)
         
         # Create the plot
         fig, ax = plt.subplots(figsize=self.figsize)
@@ -325,34 +523,31 @@ class SpillVisualization:
         ax.set_xticklabels(substance_counts.index, rotation=45, ha='right')
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 5,
-                   f'{int(height)}', ha='center', va='bottom', fontweight='bold')
+        ax.bar_label(bars, labels=[f'{int(v)}' for v in substance_counts.values],
+                     padding=3, fontweight='bold')
         
         ax.grid(True, alpha=0.3, axis='y')
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
-    def create_interactive_geographic_map(self):
+    def create_interactive_geographic_map(self, cluster: bool = None):
         """
         Create an interactive map showing spill incidents by location.
         
+        Args:
+            cluster (bool): Cluster markers on the client with FastMarkerCluster
+                instead of drawing sized circles; by default only for more than
+                MARKER_CLUSTER_MIN_POINTS towns
+        
         Returns:
             folium.Map: Interactive map object
         """
         # Get incident counts by town
-        town_counts = self.data.groupby('town').agg({
-            'case_number': 'count',
-            'total_quantity_equivalent': 'sum'
-        }).rename(columns={'case_number': 'incident_count'})
+        town_counts = self._town_agg.rename(columns={'case_number': 'incident_count'})
         
         # Connecticut coordinates (approximate center)
         ct_coords = [41.6032, -73.0877]
@@ -363,18 +558,45 @@ class SpillVisualization:
         
         # Add incident data (simplified - would need geocoding for exact coordinates)
         # This is a conceptual implementation
-        for town, data in town_counts.iterrows():
-            if pd.notna(town):
-                # Add markers (coordinates would need to be geocoded)
-                folium.CircleMarker(
-                    location=[ct_coords[0] + np.random.uniform(-0.5, 0.5),
-                             ct_coords[1] + np.random.uniform(-0.5, 0.5)],
-                    radius=min(data['incident_count'] / 10, 50),
-                    popup=f"Town: {town}<br>Incidents: {data['incident_count']}<br>Total Quantity: {data['total_quantity_equivalent']:.2f}",
-                    color='red',
-                    fill=True,
-                    fillOpacity=0.6
-                ).add_to(m)
+        town_counts = town_counts[town_counts.index.notna()]
+        
+        # Marker positions, sizes and popups are prepared for all towns at once
+        # (coordinates would need to be geocoded)
+        offsets = self._rng.uniform(-0.5, 0.5, size=(len(town_counts), 2))
+        locations = (np.asarray(ct_coords) + offsets).tolist()
+        radii = np.minimum(town_counts['incident_count'].to_numpy() / 10, 50).tolist()
+        popups = [
+            f"Town: {town}<br>Incidents: {count}<br>Total Quantity: {quantity:.2f}"
+            for town, count, quantity in zip(town_counts.index,
+                                             town_counts['incident_count'],
+                                             town_counts['total_quantity_equivalent'])
+        ]
+        
+        if cluster is None:
+            cluster = len(town_counts) > MARKER_CLUSTER_MIN_POINTS
+        
+        if cluster:
+            # One JavaScript array of points; the browser builds and clusters
+            # the markers, keeping the popups
+            FastMarkerCluster(
+                [[lat, lon, popup] for (lat, lon), popup in zip(locations, popups)],
+                callback=_CLUSTER_MARKER_CALLBACK,
+                name='Spill Incidents'
+            ).add_to(m)
+            return m
+        
+        # Collect the markers in one layer and attach it to the map once
+        markers = folium.FeatureGroup(name='Spill Incidents')
+        for location, radius, popup in zip(locations, radii, popups):
+            markers.add_child(folium.CircleMarker(
+                location=location,
+                radius=radius,
+                popup=popup,
+                color='red',
+                fill=True,
+                fillOpacity=0.6
+            ))
+        markers.add_to(m)
         
         return m
     
@@ -386,14 +608,7 @@ class SpillVisualization:
             plotly.graph_objects.Figure: Interactive time series plot
         """
         # Create monthly time series
-        monthly_data = self.data.groupby([
-            self.data['release_datetime'].dt.to_period('M')
-        ]).agg({
-            'case_number': 'count',
-            'total_quantity_equivalent': 'sum'
-        }).reset_index()
-        
-        monthly_data['date'] = monthly_data['release_datetime'].dt.to_timestamp()
+        monthly_data = self._monthly_agg.rename_axis('date').reset_index()
         
         # Create subplot
         fig = make_subplots(
@@ -404,7 +619,7 @@ class SpillVisualization:
         
         # Add incident count trace
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=monthly_data['date'],
                 y=monthly_data['case_number'],
                 mode='lines+markers',
@@ -417,7 +632,7 @@ class SpillVisualization:
         
         # Add quantity trace
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=monthly_data['date'],
                 y=monthly_data['total_quantity_equivalent'],
                 mode='lines+markers',
@@ -462,8 +677,14 @@ class SpillVisualization:
             print("Not enough numeric columns for correlation analysis")
             return None
         
-        # Calculate correlation matrix
-        corr_matrix = self.data[available_cols].corr()
+        # Calculate correlation matrix on the complete rows in one NumPy call
+        # (constant columns give NaN, as with DataFrame.corr)
+        values = self.data[available_cols].to_numpy(dtype=np.float64)
+        # Column-major layout keeps each variable contiguous for the reductions
+        values = np.asfortranarray(values[~np.isnan(values).any(axis=1)])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(values, rowvar=False)
+        corr_matrix = pd.DataFrame(corr, index=available_cols, columns=available_cols)
         
         # Create the plot
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -477,10 +698,7 @@ class SpillVisualization:
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        self._finish_figure(fig, save_path)
         
         return fig
     
@@ -491,80 +709,89 @@ class SpillVisualization:
         Returns:
             dict: Dictionary containing processed data for dashboard
         """
+        # Everything except the quantity totals comes from the cached
+        # aggregations; the totals take a single pass over the quantities
+        cause_counts = _top_counts(self._cause_counts)
+        substance_counts = _top_counts(self._substance_counts)
+        quantities = self.data['total_quantity_equivalent'].to_numpy(dtype=float)
+        quantities = quantities[~np.isnan(quantities)]
+        total_quantity = quantities.sum()
+        
         dashboard_data = {
             'summary_stats': {
                 'total_incidents': len(self.data),
-                'total_quantity': self.data['total_quantity_equivalent'].sum(),
-                'avg_quantity': self.data['total_quantity_equivalent'].mean(),
-                'top_town': self.data['town'].value_counts().index[0],
-                'peak_hour': self.data['release_hour'].mode().iloc[0] if not self.data['release_hour'].mode().empty else 'N/A',
-                'primary_cause': self.data['cause_category'].value_counts().index[0],
-                'primary_substance': self.data['substance_category'].value_counts().index[0]
+                'total_quantity': total_quantity,
+                'avg_quantity': total_quantity / len(quantities) if len(quantities) else np.nan,
+                'top_town': _top_counts(self._town_counts, 1).index[0],
+                'peak_hour': self._hourly_counts.idxmax() if not self._hourly_counts.empty else 'N/A',
+                'primary_cause': cause_counts.index[0],
+                'primary_substance': substance_counts.index[0]
             },
-            'town_data': self.data.groupby('town').agg({
-                'case_number': 'count',
-                'total_quantity_equivalent': 'sum'
-            }).reset_index(),
-            'time_data': self.data.groupby('release_hour').size().reset_index(name='count'),
-            'cause_data': self.data['cause_category'].value_counts().reset_index(),
-            'substance_data': self.data['substance_category'].value_counts().reset_index(),
-            'monthly_trends': self.data.groupby([
-                self.data['release_datetime'].dt.to_period('M')
-            ]).size().reset_index(name='count')
+            'town_data': self._town_agg.reset_index(),
+            'time_data': self._hourly_counts.reset_index(name='count'),
+            'cause_data': cause_counts.reset_index(),
+            'substance_data': substance_counts.reset_index(),
+            'monthly_trends': self._monthly_counts.reset_index(name='count')
         }
         
         return dashboard_data
     
-    def save_all_figures(self, output_dir: str = 'reports/figures'):
+    def save_all_figures(self, output_dir: str = 'reports/figures', parallel: bool = True,
+                         publication: bool = False):
         """
         Generate and save all research figures.
         
         Args:
             output_dir (str): Directory to save figures
+            parallel (bool): Render the figures in separate worker processes
+            publication (bool): Save at 300 dpi cropped to content, for reports
         """
-        import os
         os.makedirs(output_dir, exist_ok=True)
         
         print("Generating all research figures...")
         
-        # Year-wise incidents analysis
-        self.year_wise_incidents_by_cities(
-            save_path=f'{output_dir}/year_wise_incidents_by_cities.png'
-        )
-        
-        # Cities with highest spills analysis
-        self.cities_highest_spills(
-            save_path=f'{output_dir}/cities_highest_spills.png'
-        )
-        
-        # Time of day analysis
-        self.time_of_day_incidents(
-            save_path=f'{output_dir}/time_of_day_incidents.png'
-        )
-        
-        # Main causes analysis
-        self.main_causes_analysis(
-            save_path=f'{output_dir}/main_causes_analysis.png'
-        )
-        
-        # Spill amount analysis
-        self.spill_amount_per_incident(
-            save_path=f'{output_dir}/spill_amount_per_incident.png'
-        )
-        
-        # Common substances analysis
-        self.common_substances_analysis(
-            save_path=f'{output_dir}/common_substances_analysis.png'
-        )
-        
-        # Additional analysis
-        self.create_correlation_heatmap(
-            save_path=f'{output_dir}/correlation_heatmap.png'
-        )
+        method_names = [name for name, _ in FIGURE_METHODS]
+        file_stems = [stem for _, stem in FIGURE_METHODS]
+        dpi, tight = (300, True) if publication else (self.dpi, self.tight)
+        max_workers = min(len(FIGURE_METHODS), os.cpu_count() or 1)
+        
+        if parallel and max_workers > 1:
+            # Each figure is independent, so they are rendered concurrently;
+            # every worker receives the data once and builds its own instance
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_figure_worker,
+                                     initargs=(self.data, self.figsize, dpi, tight)) as executor:
+                list(executor.map(_render_figure, method_names, file_stems,
+                                  [output_dir] * len(FIGURE_METHODS)))
+        else:
+            previous = self.dpi, self.tight
+            self.dpi, self.tight = dpi, tight
+            try:
+                for name, stem in FIGURE_METHODS:
+                    getattr(self, name)(save_path=f'{output_dir}/{stem}.png')
+            finally:
+                self.dpi, self.tight = previous
         
         print(f"All figures saved to {output_dir}")
 
 
+# Per-process instance used by save_all_figures workers
+_worker_viz = None
+
+
+def _init_figure_worker(data: pd.DataFrame, figsize: tuple, dpi: int, tight: bool):
+    """Set up a headless SpillVisualization in a worker process."""
+    global _worker_viz
+    plt.switch_backend('Agg')
+    _worker_viz = SpillVisualization(data, figsize, interactive=False, dpi=dpi, tight=tight)
+
+
+def _render_figure(method_name: str, file_stem: str, output_dir: str):
+    """Render and save one figure in a worker process."""
+    getattr(_worker_viz, method_name)(save_path=f'{output_dir}/{file_stem}.png')
+    plt.close('all')
+
+
 # Example usage
 if __name__ == "__main__":
     # This would be used with actual processed data